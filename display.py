@@ -0,0 +1,263 @@
+"""
+Display Module
+
+Formats and prints game output: header, location and stats panels,
+and per-turn feedback. Location and stats panels are rendered once per
+distinct state and cached, so redrawing an unchanged panel is a single
+write.
+"""
+
+import functools
+import sys
+from collections import OrderedDict
+
+
+# Rendered panels kept per cache (least recently used are evicted)
+CACHE_SIZE = 32
+
+_LOCATION_CACHE: OrderedDict = OrderedDict()
+_STATS_CACHE: OrderedDict = OrderedDict()
+
+
+def _render_cached(cache: OrderedDict, key: tuple, render) -> str:
+    """
+    Return the cached rendering for key, rendering it on a miss.
+    
+    Args:
+        cache (OrderedDict): LRU cache to look in
+        key (tuple): Fingerprint of the displayed state
+        render (callable): Builds the text when it is not cached
+    
+    Returns:
+        str: Rendered text
+    """
+    text = cache.get(key)
+    if text is None:
+        text = render()
+        cache[key] = text
+        if len(cache) > CACHE_SIZE:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(key)
+    return text
+
+
+@functools.lru_cache(maxsize=512)
+def _pretty(name):
+    """Title-case an identifier for display ('rusty_cave' -> 'Rusty Cave')."""
+    return name.replace('_', ' ').title()
+
+
+@functools.lru_cache(maxsize=512)
+def _pretty_cap(name):
+    """Sentence-case an identifier for display ('trap_sprung' -> 'Trap sprung')."""
+    return name.replace('_', ' ').capitalize()
+
+
+# Static text, built once at import
+_HEADER = (
+    "\n" + "=" * 60 + "\n"
+    "    🗡️  LLM-DRIVEN TEXT ADVENTURE RPG  🗡️\n"
+    + "=" * 60 + "\n"
+    "Powered by Qwen2.5-14B Semantic World Engine\n"
+    + "=" * 60 + "\n\n"
+)
+_SEPARATOR = "\n" + "-" * 60 + "\n\n"
+
+
+def print_header():
+    """Print the game header."""
+    sys.stdout.write(_HEADER)
+
+
+def print_separator():
+    """Print a visual separator."""
+    sys.stdout.write(_SEPARATOR)
+
+
+def print_location(location_data, location_id):
+    """
+    Display current location details.
+    
+    Args:
+        location_data (dict): Location information
+        location_id (str): Current location identifier
+    """
+    description = location_data.get('description', 'A mysterious place.')
+    items = location_data.get('items_present', [])
+    npcs = location_data.get('npcs_present', [])
+    exits = location_data.get('exits', {})
+    
+    def render():
+        lines = [
+            f"\n📍 Location: {_pretty(location_id)}",
+            f"\n{description}"
+        ]
+        
+        # Display items
+        if items:
+            lines.append(f"\n🎒 Items here: {', '.join(items)}")
+        
+        # Display NPCs
+        if npcs:
+            lines.append(f"\n👥 NPCs present: {', '.join(npcs)}")
+        
+        # Display exits
+        if exits:
+            exit_list = [f"{direction} → {dest}" for direction, dest in exits.items()]
+            lines.append(f"\n🚪 Exits: {', '.join(exit_list)}")
+        
+        return "\n".join(lines) + "\n"
+    
+    key = (location_id, description, tuple(items), tuple(npcs), tuple(exits.items()))
+    sys.stdout.write(_render_cached(_LOCATION_CACHE, key, render))
+
+
+def print_player_stats(player_data):
+    """
+    Display player statistics.
+    
+    Args:
+        player_data (dict): Player information
+    """
+    health = player_data.get('health', 100)
+    gold = player_data.get('gold', 0)
+    xp = player_data.get('xp', 0)
+    inventory = player_data.get('inventory', [])
+    
+    def render():
+        stats_line = f"\n❤️  Health: {health} | 💰 Gold: {gold} | ⭐ XP: {xp}"
+        if inventory:
+            return f"{stats_line}\n🎒 Inventory: {', '.join(inventory)}\n"
+        return f"{stats_line}\n🎒 Inventory: Empty\n"
+    
+    key = (health, gold, xp, tuple(inventory))
+    sys.stdout.write(_render_cached(_STATS_CACHE, key, render))
+
+
+def _action_feedback(actions):
+    """Feedback lines for player_actions."""
+    return [f"\n✨ You: {', '.join(actions)}"]
+
+
+def _inventory_feedback(inv_changes):
+    """Feedback lines for inventory_changes."""
+    lines = []
+    added = inv_changes.get('added', [])
+    removed = inv_changes.get('removed', [])
+    
+    if added:
+        lines.append(f"📦 Gained: {', '.join(added)}")
+    if removed:
+        lines.append(f"📤 Lost: {', '.join(removed)}")
+    return lines
+
+
+def _interaction_feedback(interactions):
+    """Feedback lines for entity_interactions."""
+    lines = []
+    for interaction in interactions:
+        entity_id = interaction.get('id', 'something')
+        action = interaction.get('action', 'interacted with')
+        outcome = interaction.get('outcome', '')
+        
+        msg = f"⚔️  {_pretty_cap(action)} {entity_id}"
+        if outcome:
+            msg += f" - {outcome}"
+        lines.append(msg)
+    return lines
+
+
+def _stats_feedback(stats):
+    """Feedback lines for player_stats_changes."""
+    lines = []
+    health_change = stats.get('health_change', 0)
+    gold_change = stats.get('gold_change', 0)
+    xp_gained = stats.get('xp_gained', 0)
+    
+    if health_change != 0:
+        symbol = "+" if health_change > 0 else ""
+        lines.append(f"❤️  Health {symbol}{health_change}")
+    
+    if gold_change != 0:
+        symbol = "+" if gold_change > 0 else ""
+        lines.append(f"💰 Gold {symbol}{gold_change}")
+    
+    if xp_gained > 0:
+        lines.append(f"⭐ XP +{xp_gained}")
+    return lines
+
+
+def _quest_feedback(quests):
+    """Feedback lines for quest_updates."""
+    return [
+        f"📜 Quest '{quest.get('quest_id', 'Unknown')}': {quest.get('status', 'updated')}"
+        for quest in quests
+    ]
+
+
+def _event_feedback(events):
+    """Feedback lines for game_events."""
+    return [f"⚡ {_pretty_cap(event)}!" for event in events]
+
+
+def _hint_feedback(hint):
+    """Feedback lines for narrative_hint."""
+    return [f"\n💭 {hint}"]
+
+
+# Feedback builders keyed by update field, in display order. Fields with
+# no player-facing feedback (location_changes) are absent.
+_FIELD_FEEDBACK = {
+    'player_actions': _action_feedback,
+    'inventory_changes': _inventory_feedback,
+    'entity_interactions': _interaction_feedback,
+    'player_stats_changes': _stats_feedback,
+    'quest_updates': _quest_feedback,
+    'game_events': _event_feedback,
+    'narrative_hint': _hint_feedback,
+}
+
+
+def print_field_feedback(field, value):
+    """
+    Display feedback for a single update field.
+    
+    Lets a streamed update be reported field by field as the LLM
+    produces it, with the same output as print_update_feedback.
+    
+    Args:
+        field (str): Top-level update key (e.g. 'inventory_changes')
+        value: That key's value
+    """
+    feedback = _FIELD_FEEDBACK.get(field)
+    if feedback is None or not value:
+        return
+    
+    lines = feedback(value)
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def print_update_feedback(update_data, exclude=frozenset()):
+    """
+    Display feedback about what happened during the turn.
+    
+    The whole block is assembled first and written in one call.
+    
+    Args:
+        update_data (dict): Update information from LLM parser
+        exclude (frozenset): Fields already reported (e.g. while streaming)
+    """
+    # One lookup per field, through a bound method hoisted out of the loop
+    get = update_data.get
+    parts = []
+    for field, feedback in _FIELD_FEEDBACK.items():
+        if field in exclude:
+            continue
+        value = get(field)
+        if value:
+            parts.extend(feedback(value))
+    
+    if parts:
+        sys.stdout.write("\n".join(parts) + "\n")
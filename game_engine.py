@@ -6,20 +6,64 @@ and handles loading/saving to JSON files.
 """
 
 import json
+import logging
 import os
-from typing import Dict, Any, Optional
-from copy import deepcopy
+import shutil
+import threading
+from collections import Counter, deque
+from itertools import islice
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
+
+from json_utils import dumps_bytes, dumps_line, fast_deepcopy, loads
+
+
+logger = logging.getLogger(__name__)
+
+# Write buffer for save files; large enough that a typical save is one write()
+SAVE_BUFFER_SIZE = 128 * 1024
+
+# Number of journaled updates after which a full snapshot is written
+SNAPSHOT_INTERVAL = 50
+
+# Longest wait before a requested background save runs (seconds)
+SAVE_DEBOUNCE = 0.5
+
+# Snapshot key holding the sequence number of the last journaled update
+# it contains; journal entries at or below it are already applied
+JOURNAL_SEQ_KEY = 'journal_seq'
+
+# Maximum number of events kept in event_history
+EVENT_HISTORY_LIMIT = 100
+
+# Number of most recent events included in the LLM context view
+CONTEXT_EVENT_COUNT = 5
+
+# Interaction outcomes that remove an NPC from the world
+DEFEAT_OUTCOMES = frozenset({'killed', 'defeated', 'destroyed'})
 
 
 class GameEngine:
     """
     Core game engine responsible for managing world state.
     
+    Every applied update is appended to a delta log (deltas.jsonl), so
+    progress is persisted per turn without rewriting the whole state.
+    A full snapshot is written to current_state.json every
+    SNAPSHOT_INTERVAL updates and on save_state(), which resets the log.
+    Journal entries carry increasing sequence numbers and the snapshot
+    records the last one it includes, so entries that survive a crash
+    between writing the snapshot and removing the log are not re-applied.
+    
     Attributes:
         game_state (dict): Current complete game state
         game_data_dir (str): Path to game data directory
         current_state_file (str): Path to current save file
         initial_state_file (str): Path to initial state template
+        delta_log_file (str): Path to the journal of updates since the last snapshot
+        state_version (int): Counter bumped whenever game_state changes
+        save_scheduler (SaveScheduler): If set, periodic snapshots are
+            written by it in the background instead of inline
     """
     
     def __init__(self, game_data_dir: str = "game_data"):
@@ -32,21 +76,40 @@ class GameEngine:
         self.game_data_dir = game_data_dir
         self.current_state_file = os.path.join(game_data_dir, "current_state.json")
         self.initial_state_file = os.path.join(game_data_dir, "initial_state.json")
+        self.delta_log_file = os.path.join(game_data_dir, "deltas.jsonl")
         self.game_state: Dict[str, Any] = {}
+        self.state_version = 0
+        self._delta_log = None
+        self._updates_since_snapshot = 0
+        self._journal_seq = 0
+        self._replaying = False
+        self.save_scheduler: Optional['SaveScheduler'] = None
+        # Held while game_state is mutated or serialized, so a background
+        # save never sees a half-applied update
+        self._lock = threading.RLock()
     
     def load_state(self) -> bool:
         """
         Load game state from current_state.json, or initial_state.json if not found.
         
+        Updates journaled in deltas.jsonl since the last snapshot are
+        replayed on top of current_state.json.
+        
         Returns:
             bool: True if load successful, False otherwise
         """
         # Try loading current state first
         if os.path.exists(self.current_state_file):
             try:
-                with open(self.current_state_file, 'r', encoding='utf-8') as f:
-                    self.game_state = json.load(f)
+                with open(self.current_state_file, 'rb') as f:
+                    self.game_state = loads(f.read())
+                self._prepare_loaded_state()
                 print(f"📂 Loaded save from: {self.current_state_file}")
+                if os.path.exists(self.delta_log_file):
+                    replayed = self._replay_deltas()
+                    print(f"📂 Restored {replayed} turn(s) from: {self.delta_log_file}")
+                    # Fold the replayed turns into a fresh snapshot
+                    self.save_state()
                 return True
             except json.JSONDecodeError as e:
                 print(f"⚠️  Corrupted save file: {e}")
@@ -55,11 +118,13 @@ class GameEngine:
         # Load initial state
         if os.path.exists(self.initial_state_file):
             try:
-                with open(self.initial_state_file, 'r', encoding='utf-8') as f:
-                    self.game_state = json.load(f)
+                with open(self.initial_state_file, 'rb') as f:
+                    self.game_state = loads(f.read())
+                self._prepare_loaded_state()
                 print(f"📂 Loaded initial state from: {self.initial_state_file}")
-                # Save as current state
-                self.save_state()
+                # Save as current state: the file is already valid JSON, so
+                # copy its bytes rather than re-serializing the loaded dict
+                self._copy_initial_state()
                 return True
             except json.JSONDecodeError as e:
                 print(f"❌ Error loading initial state: {e}")
@@ -68,6 +133,32 @@ class GameEngine:
         print("❌ No game state files found!")
         return False
     
+    def _copy_initial_state(self) -> None:
+        """Replace current_state.json with a byte copy of initial_state.json."""
+        try:
+            # Drop the old game's journal first, so it can never be replayed
+            # onto the fresh state
+            self._reset_delta_log()
+            tmp_file = self.current_state_file + '.tmp'
+            shutil.copyfile(self.initial_state_file, tmp_file)
+            os.replace(tmp_file, self.current_state_file)
+        except OSError as e:
+            print(f"❌ Error saving game state: {e}")
+    
+    def _prepare_loaded_state(self) -> None:
+        """
+        Convert freshly loaded JSON into the in-memory representation.
+        
+        event_history becomes a bounded deque so appends evict old events
+        in O(1); it is written back out as a JSON list. The snapshot's
+        journal sequence number is moved out of the state.
+        """
+        self._journal_seq = self.game_state.pop(JOURNAL_SEQ_KEY, 0)
+        self.game_state['event_history'] = deque(
+            self.game_state.get('event_history', []), maxlen=EVENT_HISTORY_LIMIT
+        )
+        self.state_version += 1
+    
     def save_state(self) -> bool:
         """
         Save current game state to current_state.json.
@@ -75,19 +166,92 @@ class GameEngine:
         Returns:
             bool: True if save successful, False otherwise
         """
+        with self._lock:
+            return self._write_snapshot()
+    
+    def _write_snapshot(self) -> bool:
+        """Write current_state.json and reset the delta log (lock held)."""
         try:
             # Ensure directory exists
             os.makedirs(self.game_data_dir, exist_ok=True)
             
-            # Write to file with pretty formatting
-            with open(self.current_state_file, 'w', encoding='utf-8') as f:
-                json.dump(self.game_state, f, indent=2, ensure_ascii=False)
+            # Write to a temp file and rename it over the save, so a crash
+            # mid-write never leaves a truncated current_state.json behind
+            tmp_file = self.current_state_file + '.tmp'
+            with open(tmp_file, 'wb', buffering=SAVE_BUFFER_SIZE) as f:
+                f.write(dumps_bytes({**self.game_state, JOURNAL_SEQ_KEY: self._journal_seq}))
+            os.replace(tmp_file, self.current_state_file)
+            
+            # The snapshot now contains every journaled update
+            self._reset_delta_log()
             
             return True
-        except Exception as e:
-            print(f"❌ Error saving game state: {e}")
+        except (OSError, TypeError, ValueError):
+            # TypeError/ValueError: state holds something JSON cannot encode
+            logger.exception("❌ Error saving game state to %s", self.current_state_file)
             return False
     
+    def _log_delta(self, update_data: Dict[str, Any]) -> None:
+        """
+        Append an applied update to the delta log.
+        
+        Args:
+            update_data (dict): Update that was applied to game state
+        
+        Raises:
+            OSError: If the log cannot be written
+        """
+        self._journal_seq += 1
+        if self._delta_log is None:
+            os.makedirs(self.game_data_dir, exist_ok=True)
+            self._delta_log = open(self.delta_log_file, 'ab')
+        
+        self._delta_log.write(dumps_line({'seq': self._journal_seq, 'update': update_data}))
+        self._delta_log.flush()
+        self._updates_since_snapshot += 1
+    
+    def _reset_delta_log(self) -> None:
+        """Discard the delta log after a full snapshot has been written."""
+        if self._delta_log is not None:
+            self._delta_log.close()
+            self._delta_log = None
+        
+        if os.path.exists(self.delta_log_file):
+            os.remove(self.delta_log_file)
+        
+        self._updates_since_snapshot = 0
+    
+    def _replay_deltas(self) -> int:
+        """
+        Re-apply updates journaled since the last snapshot.
+        
+        A truncated final line (crash mid-append) is ignored, and so are
+        entries the snapshot already contains.
+        
+        Returns:
+            int: Number of updates replayed
+        """
+        replayed = 0
+        self._replaying = True
+        try:
+            with open(self.delta_log_file, 'rb') as f:
+                for line in f:
+                    try:
+                        entry = loads(line)
+                        seq = entry['seq']
+                        update_data = entry['update']
+                    except (json.JSONDecodeError, TypeError, KeyError):
+                        break
+                    if seq <= self._journal_seq:
+                        continue
+                    self.apply_update(update_data)
+                    self._journal_seq = seq
+                    replayed += 1
+        finally:
+            self._replaying = False
+        
+        return replayed
+    
     def get_state(self) -> Dict[str, Any]:
         """
         Get a copy of the current game state.
@@ -95,7 +259,61 @@ class GameEngine:
         Returns:
             dict: Deep copy of game state
         """
-        return deepcopy(self.game_state)
+        return fast_deepcopy(self.game_state)
+    
+    def get_state_readonly(self) -> Mapping[str, Any]:
+        """
+        Get a read-only view of the current game state without copying.
+        
+        Use this for callers that only read or serialize the state, such
+        as display and prompt building. Nested values are shared with the
+        engine and must not be modified.
+        
+        Returns:
+            Mapping: Read-only view of game state
+        """
+        return MappingProxyType(self.game_state)
+    
+    def get_context_view(self) -> Dict[str, Any]:
+        """
+        Get the slice of game state relevant to the player's next action.
+        
+        The view keeps the layout of the full state but only includes the
+        current and adjacent locations, NPCs present in the current
+        location, unfinished quests and the most recent events. Values are
+        shared with the engine and must not be modified.
+        
+        Returns:
+            dict: Read-only projection of game state for LLM prompts
+        """
+        player = self.game_state.get('player', {})
+        locations = self.game_state.get('locations', {})
+        npcs = self.game_state.get('npcs', {})
+        quests = self.game_state.get('quests', {})
+        history = self.game_state.get('event_history', ())
+        
+        location_id = player.get('location_id')
+        current = locations.get(location_id, {})
+        
+        # Current location plus every location reachable through its exits
+        visible_ids = [location_id, *current.get('exits', {}).values()]
+        visible_locations = {
+            loc_id: locations[loc_id] for loc_id in visible_ids if loc_id in locations
+        }
+        
+        return {
+            'player': player,
+            'locations': visible_locations,
+            'npcs': {
+                npc_id: npcs[npc_id]
+                for npc_id in current.get('npcs_present', []) if npc_id in npcs
+            },
+            'quests': {
+                quest_id: quest for quest_id, quest in quests.items()
+                if quest.get('status') not in ('completed', 'failed')
+            },
+            'event_history': list(islice(history, max(0, len(history) - CONTEXT_EVENT_COUNT), None))
+        }
     
     def apply_update(self, update_data: Dict[str, Any]) -> bool:
         """
@@ -107,98 +325,129 @@ class GameEngine:
         Returns:
             bool: True if update applied successfully
         """
-        try:
-            # Ensure player exists
-            if 'player' not in self.game_state:
-                self.game_state['player'] = {
-                    'location_id': 'start',
-                    'inventory': [],
-                    'health': 100,
-                    'gold': 0,
-                    'xp': 0
-                }
-            
-            player = self.game_state['player']
-            
-            # Apply inventory changes
-            self._apply_inventory_changes(update_data.get('inventory_changes', {}))
-            
-            # Apply location changes
-            self._apply_location_changes(update_data.get('location_changes', {}))
-            
-            # Apply player stats changes
-            self._apply_stats_changes(update_data.get('player_stats_changes', {}))
-            
-            # Apply room state updates
-            self._apply_room_updates(update_data.get('location_changes', {}).get('room_state_updates', []))
-            
-            # Apply entity interactions
-            self._apply_entity_interactions(update_data.get('entity_interactions', []))
+        # Bump up front: even an update that fails halfway may have mutated state
+        self.state_version += 1
+        
+        with self._lock:
+            try:
+                # Ensure player exists
+                if 'player' not in self.game_state:
+                    self.game_state['player'] = {
+                        'location_id': 'start',
+                        'inventory': [],
+                        'health': 100,
+                        'gold': 0,
+                        'xp': 0
+                    }
+                
+                player = self.game_state['player']
+                location_changes = update_data.get('location_changes', {})
+                
+                # Apply inventory changes
+                self._apply_inventory_changes(update_data.get('inventory_changes', {}), player)
+                
+                # Apply location changes
+                self._apply_location_changes(location_changes, player)
+                
+                # Apply player stats changes
+                self._apply_stats_changes(update_data.get('player_stats_changes', {}), player)
+                
+                # Resolve the (possibly new) current room once for the room-level helpers
+                room = self.game_state.get('locations', {}).get(player.get('location_id'))
+                
+                # Apply room state updates
+                self._apply_room_updates(location_changes.get('room_state_updates', []), room)
+                
+                # Apply entity interactions
+                self._apply_entity_interactions(
+                    update_data.get('entity_interactions', []), self.game_state.get('npcs', {}), room
+                )
+                
+                # Apply quest updates
+                self._apply_quest_updates(update_data.get('quest_updates', []))
+                
+                # Process game events
+                self._process_game_events(update_data.get('game_events', []))
             
-            # Apply quest updates
-            self._apply_quest_updates(update_data.get('quest_updates', []))
+            except Exception as e:
+                print(f"❌ Error applying update: {e}")
+                # Changes made before the error stay in memory; journal the
+                # update anyway, since replaying it fails at the same point
+                # and reproduces exactly this state
+                if not self._replaying:
+                    self._persist_update(update_data)
+                return False
             
-            # Process game events
-            self._process_game_events(update_data.get('game_events', []))
+            # Journaling problems are handled without reporting the turn as failed
+            if not self._replaying:
+                self._persist_update(update_data)
             
             return True
+    
+    def _persist_update(self, update_data: Dict[str, Any]) -> None:
+        """
+        Journal an applied update, snapshotting periodically to keep replay short.
         
-        except Exception as e:
-            print(f"❌ Error applying update: {e}")
-            return False
+        If the journal cannot be written (I/O or encoding error), a full
+        snapshot is written at once instead, so the turn is not lost.
+        
+        Args:
+            update_data (dict): Update that was applied to game state
+        """
+        try:
+            self._log_delta(update_data)
+        except (OSError, TypeError, ValueError):
+            logger.exception("❌ Error journaling turn to %s", self.delta_log_file)
+            self._write_snapshot()
+            return
+        
+        if self._updates_since_snapshot >= SNAPSHOT_INTERVAL:
+            if self.save_scheduler is not None:
+                self.save_scheduler.request_save()
+            else:
+                self._write_snapshot()
     
-    def _apply_inventory_changes(self, changes: Dict[str, list]) -> None:
+    def _apply_inventory_changes(self, changes: Dict[str, list], player: Dict[str, Any]) -> None:
         """
         Apply inventory changes to player.
         
         Args:
             changes (dict): Inventory change data
+            player (dict): Player state to update
         """
-        player = self.game_state['player']
-        inventory = player.get('inventory', [])
-        
-        # Add items
-        for item in changes.get('added', []):
-            if item not in inventory:
-                inventory.append(item)
-        
-        # Remove items
-        for item in changes.get('removed', []):
-            if item in inventory:
-                inventory.remove(item)
+        # dict.fromkeys gives O(1) membership while keeping acquisition order
+        inventory = dict.fromkeys(player.get('inventory', []))
+        inventory.update(dict.fromkeys(changes.get('added', [])))
+        removed = set(changes.get('removed', []))
+        player['inventory'] = [item for item in inventory if item not in removed]
         
         # Handle equipped/unequipped (for future use)
-        if 'equipped' in changes:
-            player['equipped'] = player.get('equipped', []) + changes['equipped']
-        
-        if 'unequipped' in changes:
-            equipped = player.get('equipped', [])
-            for item in changes['unequipped']:
-                if item in equipped:
-                    equipped.remove(item)
-        
-        player['inventory'] = inventory
+        if 'equipped' in changes or 'unequipped' in changes:
+            equipped = dict.fromkeys(player.get('equipped', []))
+            equipped.update(dict.fromkeys(changes.get('equipped', [])))
+            unequipped = set(changes.get('unequipped', []))
+            player['equipped'] = [item for item in equipped if item not in unequipped]
     
-    def _apply_location_changes(self, changes: Dict[str, Any]) -> None:
+    def _apply_location_changes(self, changes: Dict[str, Any], player: Dict[str, Any]) -> None:
         """
         Apply location changes (player movement).
         
         Args:
             changes (dict): Location change data
+            player (dict): Player state to update
         """
         new_location = changes.get('new_location_id')
         if new_location:
-            self.game_state['player']['location_id'] = new_location
+            player['location_id'] = new_location
     
-    def _apply_stats_changes(self, changes: Dict[str, int]) -> None:
+    def _apply_stats_changes(self, changes: Dict[str, int], player: Dict[str, Any]) -> None:
         """
         Apply player stat changes.
         
         Args:
             changes (dict): Stat change data
+            player (dict): Player state to update
         """
-        player = self.game_state['player']
-        
         # Apply health change
         health_change = changes.get('health_change', 0)
         if health_change != 0:
@@ -219,20 +468,18 @@ class GameEngine:
         if xp_gained > 0:
             player['xp'] = player.get('xp', 0) + xp_gained
     
-    def _apply_room_updates(self, updates: list) -> None:
+    def _apply_room_updates(self, updates: list, current_room: Optional[Dict[str, Any]]) -> None:
         """
         Apply updates to room objects/features.
         
         Args:
             updates (list): List of room state updates
+            current_room (dict or None): Player's current location, if known
         """
-        player_location = self.game_state['player'].get('location_id')
-        locations = self.game_state.get('locations', {})
-        
-        if player_location not in locations:
+        if current_room is None:
             return
         
-        current_room = locations[player_location]
+        missing = set()
         
         for update in updates:
             object_id = update.get('object_id')
@@ -244,47 +491,65 @@ class GameEngine:
             
             current_room['object_states'][object_id] = new_state
             
-            # If state is "missing", remove from items_present
-            if new_state == "missing" and object_id in current_room.get('items_present', []):
-                current_room['items_present'].remove(object_id)
+            if new_state == "missing":
+                missing.add(object_id)
+        
+        # Remove missing objects from items_present in a single pass
+        if missing and 'items_present' in current_room:
+            current_room['items_present'] = [
+                item for item in current_room['items_present'] if item not in missing
+            ]
     
-    def _apply_entity_interactions(self, interactions: list) -> None:
+    def _apply_entity_interactions(self, interactions: list, npcs: Dict[str, Any],
+                                   current_room: Optional[Dict[str, Any]]) -> None:
         """
         Apply entity interactions (NPC, monster, object interactions).
         
         Args:
             interactions (list): List of entity interactions
+            npcs (dict): NPC registry from game state
+            current_room (dict or None): Player's current location, if known
         """
-        npcs = self.game_state.get('npcs', {})
-        
+        # Bucket NPC interactions by effect, then apply each bucket at once
+        hits = Counter()
+        talked_to = set()
+        defeated = set()
         for interaction in interactions:
             entity_id = interaction.get('id')
-            entity_type = interaction.get('type')
+            if interaction.get('type') != 'NPC' or entity_id not in npcs:
+                continue
+            
             action = interaction.get('action')
-            outcome = interaction.get('outcome')
+            if action == 'attacked':
+                hits[entity_id] += 1
+            elif action == 'talked_to':
+                talked_to.add(entity_id)
             
-            # Handle NPC interactions
-            if entity_type == 'NPC' and entity_id in npcs:
-                npc = npcs[entity_id]
-                
-                # Update NPC based on interaction
-                if action == 'attacked':
-                    if 'health' in npc:
-                        npc['health'] = max(0, npc.get('health', 100) - 10)
-                    npc['hostile'] = True
-                
-                elif action == 'talked_to':
-                    npc['talked'] = True
-                
-                # If outcome indicates death/removal
-                if outcome in ['killed', 'defeated', 'destroyed']:
-                    npc['alive'] = False
-                    # Remove from location
-                    player_location = self.game_state['player'].get('location_id')
-                    if player_location in self.game_state.get('locations', {}):
-                        npcs_present = self.game_state['locations'][player_location].get('npcs_present', [])
-                        if entity_id in npcs_present:
-                            npcs_present.remove(entity_id)
+            # If outcome indicates death/removal
+            if interaction.get('outcome') in DEFEAT_OUTCOMES:
+                defeated.add(entity_id)
+        
+        for npc_id, count in hits.items():
+            npc = npcs[npc_id]
+            if 'health' in npc:
+                npc['health'] = max(0, npc.get('health', 100) - 10 * count)
+            npc['hostile'] = True
+        
+        for npc_id in talked_to:
+            npcs[npc_id]['talked'] = True
+        
+        for npc_id in defeated:
+            npcs[npc_id]['alive'] = False
+        
+        # Remove defeated NPCs from the current location in a single pass,
+        # skipping the rebuild when none of them are actually here
+        if defeated and current_room is not None:
+            npcs_present = current_room.get('npcs_present', [])
+            defeated_here = defeated.intersection(npcs_present)
+            if defeated_here:
+                current_room['npcs_present'] = [
+                    npc_id for npc_id in npcs_present if npc_id not in defeated_here
+                ]
     
     def _apply_quest_updates(self, updates: list) -> None:
         """
@@ -298,6 +563,9 @@ class GameEngine:
         
         quests = self.game_state['quests']
         
+        # Group updates per quest: the last status change wins
+        statuses = {}
+        objectives: Dict[str, dict] = {}
         for update in updates:
             quest_id = update.get('quest_id')
             status = update.get('status')
@@ -309,20 +577,25 @@ class GameEngine:
                     'objectives': []
                 }
             
-            # Update quest status
             if status == 'started':
-                quests[quest_id]['status'] = 'in_progress'
-            elif status in ['completed', 'failed']:
-                quests[quest_id]['status'] = status
+                statuses[quest_id] = 'in_progress'
+            elif status in ('completed', 'failed'):
+                statuses[quest_id] = status
             
-            # Handle objective updates
             objective_id = update.get('objective_id')
             if objective_id:
-                if 'completed_objectives' not in quests[quest_id]:
-                    quests[quest_id]['completed_objectives'] = []
-                
-                if objective_id not in quests[quest_id]['completed_objectives']:
-                    quests[quest_id]['completed_objectives'].append(objective_id)
+                objectives.setdefault(quest_id, {})[objective_id] = None
+        
+        # Update quest status
+        for quest_id, status in statuses.items():
+            quests[quest_id]['status'] = status
+        
+        # Handle objective updates; dict.fromkeys de-duplicates in
+        # completion order
+        for quest_id, new_objectives in objectives.items():
+            completed = dict.fromkeys(quests[quest_id].get('completed_objectives', []))
+            completed.update(new_objectives)
+            quests[quest_id]['completed_objectives'] = list(completed)
     
     def _process_game_events(self, events: list) -> None:
         """
@@ -331,12 +604,76 @@ class GameEngine:
         Args:
             events (list): List of game events
         """
-        # Store events in game history
+        # Store events in game history; the deque drops the oldest beyond the limit
         if 'event_history' not in self.game_state:
-            self.game_state['event_history'] = []
+            self.game_state['event_history'] = deque(maxlen=EVENT_HISTORY_LIMIT)
         
         self.game_state['event_history'].extend(events)
+
+
+class SaveScheduler:
+    """
+    Debounced background saves for a GameEngine.
+    
+    request_save() starts a short timer unless one is already pending; when
+    it fires, the snapshot is written on the timer thread. A burst of
+    requests therefore costs one save, steady input cannot postpone it past
+    the first request's deadline, and the caller never waits for
+    serialization or disk IO. Writes
+    go through GameEngine.save_state(), which replaces the save file
+    atomically and holds the engine lock, so at most one save is in flight.
+    
+    Attributes:
+        engine (GameEngine): Engine whose state is saved
+        delay (float): Longest wait before a requested save runs (seconds)
+    """
+    
+    def __init__(self, engine: GameEngine, delay: float = SAVE_DEBOUNCE):
+        """
+        Initialize the scheduler.
+        
+        Args:
+            engine (GameEngine): Engine whose state is saved
+            delay (float): Longest wait before a requested save runs (seconds)
+        """
+        self.engine = engine
+        self.delay = delay
+        self._timer: Optional[threading.Timer] = None
+        self._timer_lock = threading.Lock()
+    
+    def request_save(self) -> None:
+        """Schedule a save, folding into one that has not started yet."""
+        with self._timer_lock:
+            if self._timer is not None:
+                # Already pending: that save will include this state too
+                return
+            self._timer = threading.Timer(self.delay, self._run_save)
+            self._timer.daemon = True
+            self._timer.start()
+    
+    def _run_save(self) -> None:
+        """Timer callback: release the pending slot, then save."""
+        with self._timer_lock:
+            self._timer = None
+        # Requests from here on schedule a new save, since this one may
+        # snapshot the state before they happened
+        self.engine.save_state()
+    
+    def cancel(self) -> None:
+        """Drop a pending save that has not started yet."""
+        with self._timer_lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+    
+    def flush(self) -> bool:
+        """
+        Cancel any pending save and save synchronously.
+        
+        Waits for a save already running on the timer thread to finish.
         
-        # Limit history size
-        if len(self.game_state['event_history']) > 100:
-            self.game_state['event_history'] = self.game_state['event_history'][-100:]
+        Returns:
+            bool: True if save successful, False otherwise
+        """
+        self.cancel()
+        return self.engine.save_state()
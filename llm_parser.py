@@ -5,100 +5,184 @@ Handles communication with Ollama (Qwen2.5-14B) for parsing
 player natural language input into structured JSON updates.
 """
 
+import asyncio
 import json
-from typing import Dict, Any
+from itertools import chain
+from typing import Dict, Any, Iterable, Iterator, List, Mapping, Optional, Tuple
+import fastjsonschema
 import ollama
 
+from json_utils import dumps, loads
 
-class LLMParser:
+
+def _list_of(item_type: str) -> Dict[str, Any]:
+    """Schema for an optional array of item_type values, defaulting to []."""
+    return {'type': 'array', 'items': {'type': item_type}, 'default': []}
+
+
+def _list_of_objects(properties: Dict[str, Any], required: List[str]) -> Dict[str, Any]:
     """
-    Parser that uses Qwen2.5-14B via Ollama to interpret player actions.
+    Schema for an optional array of objects, defaulting to [].
     
-    Attributes:
-        model_name (str): Name of the Ollama model to use
-        temperature (float): Temperature for generation (0.0 for deterministic)
+    The engine uses these fields as dict keys and set members, so they
+    are typed (hashable) and the identifying ones are required.
+    """
+    return {
+        'type': 'array',
+        'items': {'type': 'object', 'properties': properties, 'required': required},
+        'default': []
+    }
+
+
+def _stat_change() -> Dict[str, Any]:
+    """Schema for a stat delta; bounded so every encoder can write it as an integer."""
+    return {'type': 'integer', 'minimum': -2**63, 'maximum': 2**63 - 1, 'default': 0}
+
+
+_STRING = {'type': 'string'}
+_OPTIONAL_STRING = {'type': ['string', 'null']}
+
+
+def _section(properties: Dict[str, Any]) -> Dict[str, Any]:
+    """Schema for an optional object whose default holds every field's default."""
+    return {
+        'type': 'object',
+        'properties': properties,
+        'default': {name: prop['default'] for name, prop in properties.items()}
+    }
+
+
+# Shape of a structured update. Every field has a default, so validating
+# also fills in whatever the LLM left out.
+UPDATE_SCHEMA: Dict[str, Any] = {
+    'type': 'object',
+    'properties': {
+        'player_actions': _list_of('string'),
+        'inventory_changes': _section({
+            'added': _list_of('string'),
+            'removed': _list_of('string'),
+            'equipped': _list_of('string'),
+            'unequipped': _list_of('string')
+        }),
+        'entity_interactions': _list_of_objects({
+            'id': _STRING,
+            'type': _OPTIONAL_STRING,
+            'action': _STRING,
+            'outcome': _OPTIONAL_STRING
+        }, required=['id']),
+        'location_changes': _section({
+            'new_location_id': {'type': ['string', 'null'], 'default': None},
+            'direction_moved': {'type': ['string', 'null'], 'default': None},
+            'room_state_updates': _list_of_objects({
+                'object_id': _STRING,
+                'state': _OPTIONAL_STRING
+            }, required=['object_id'])
+        }),
+        'player_stats_changes': _section({
+            'health_change': _stat_change(),
+            'mana_change': _stat_change(),
+            'gold_change': _stat_change(),
+            'xp_gained': _stat_change()
+        }),
+        'quest_updates': _list_of_objects({
+            'quest_id': _STRING,
+            'status': _OPTIONAL_STRING,
+            'objective_id': _OPTIONAL_STRING
+        }, required=['quest_id']),
+        'game_events': _list_of('string'),
+        'narrative_hint': {'type': ['string', 'null'], 'default': None}
+    }
+}
+
+# Validator generated once at import; fills defaults in place
+_validate_update = fastjsonschema.compile(UPDATE_SCHEMA)
+
+# Per-field validators, for checking fields as they stream in. Each takes
+# a one-key update, so error messages name the field (data.<field> ...).
+_FIELD_VALIDATORS = {
+    name: fastjsonschema.compile({'type': 'object', 'properties': {name: prop}})
+    for name, prop in UPDATE_SCHEMA['properties'].items()
+}
+
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WHITESPACE = ' \t\n\r'
+
+
+def _skip_whitespace(text: str, pos: int) -> int:
+    """Return the index of the first non-whitespace character at or after pos."""
+    while pos < len(text) and text[pos] in _JSON_WHITESPACE:
+        pos += 1
+    return pos
+
+
+def _scan_fields(pieces: Iterable[str]) -> Iterator[Tuple[str, Any]]:
     """
+    Incrementally parse a streamed JSON object into its top-level members.
     
-    def __init__(self, model_name: str = "qwen2.5:14b", temperature: float = 0.0):
-        """
-        Initialize the LLM parser.
-        
-        Args:
-            model_name (str): Ollama model identifier
-            temperature (float): Generation temperature
-        """
-        self.model_name = model_name
-        self.temperature = temperature
+    Each (key, value) pair is yielded as soon as the delimiter following
+    its value has arrived, so a value is never reported half-written
+    (e.g. the number 12 of a 120 still being generated). Stops at the
+    closing brace without consuming the rest of the stream.
     
-    def parse_player_action(self, player_input: str, current_game_state: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Parse player's natural language action into structured JSON.
-        
-        Args:
-            player_input (str): Player's text input
-            current_game_state (dict): Current game world state
+    Args:
+        pieces (iterable): Chunks of JSON text, in order
+    
+    Yields:
+        tuple: (key, decoded value) for each member
+    
+    Raises:
+        json.JSONDecodeError: If the text is not a single JSON object
+    """
+    text = ''
+    pos = None  # Index after '{' or after the last complete member
+    for piece in pieces:
+        text += piece
+        if pos is None:
+            start = _skip_whitespace(text, 0)
+            if start == len(text):
+                continue
+            if text[start] != '{':
+                raise json.JSONDecodeError("Expecting '{'", text, start)
+            pos = start + 1
         
-        Returns:
-            dict: Structured update data or error information
-        """
-        try:
-            # Construct the prompt
-            prompt = self._build_prompt(player_input, current_game_state)
-            
-            # Call Ollama API
-            response = ollama.generate(
-                model=self.model_name,
-                prompt=prompt,
-                format='json',
-                options={
-                    'temperature': self.temperature,
-                    'num_predict': 1000  # Max tokens for response
-                }
-            )
-            
-            # Extract response text
-            response_text = response.get('response', '').strip()
-            
-            if not response_text:
-                return self._create_error_response("Empty response from LLM")
-            
-            # Parse JSON
+        while True:
+            i = _skip_whitespace(text, pos)
+            if i < len(text) and text[i] == '}':
+                return
+            if i < len(text) and text[i] == ',':
+                i = _skip_whitespace(text, i + 1)
+            if i < len(text) and text[i] != '"':
+                raise json.JSONDecodeError("Expecting property name enclosed in double quotes", text, i)
+            # A decode error here usually means the member is not fully
+            # generated yet; a truly malformed reply is reported at the end
             try:
-                update_data = json.loads(response_text)
-                
-                # Validate structure
-                if not isinstance(update_data, dict):
-                    return self._create_error_response("LLM response is not a JSON object")
-                
-                # Ensure all required keys exist (with defaults)
-                update_data = self._normalize_update_data(update_data)
-                
-                return update_data
-            
-            except json.JSONDecodeError as e:
-                print(f"⚠️  JSON parse error: {e}")
-                print(f"Raw response: {response_text[:200]}...")
-                return self._create_error_response(f"Invalid JSON from LLM: {str(e)}")
-        
-        except Exception as e:
-            print(f"❌ Error communicating with Ollama: {e}")
-            return self._create_error_response(f"LLM communication error: {str(e)}")
+                key, i = _JSON_DECODER.raw_decode(text, i)
+            except json.JSONDecodeError:
+                break
+            i = _skip_whitespace(text, i)
+            if i == len(text):
+                break
+            if text[i] != ':':
+                raise json.JSONDecodeError("Expecting ':' delimiter", text, i)
+            try:
+                value, i = _JSON_DECODER.raw_decode(text, _skip_whitespace(text, i + 1))
+            except json.JSONDecodeError:
+                break
+            i = _skip_whitespace(text, i)
+            if i == len(text):
+                break
+            if text[i] not in ',}':
+                raise json.JSONDecodeError("Expecting ',' delimiter", text, i)
+            yield key, value
+            pos = i
     
-    def _build_prompt(self, player_input: str, game_state: Dict[str, Any]) -> str:
-        """
-        Build the comprehensive prompt for the LLM.
-        
-        Args:
-            player_input (str): Player's action
-            game_state (dict): Current game state
-        
-        Returns:
-            str: Complete prompt for LLM
-        """
-        # Convert game state to JSON string
-        game_state_json = json.dumps(game_state, indent=2, ensure_ascii=False)
-        
-        prompt = f"""You are the Game Master for a text-based adventure RPG. Your primary role is to interpret player actions and translate them into structured JSON data that updates the game's state.
+    # Stream ended inside the object: report where the full parse fails
+    loads(text)
+    raise json.JSONDecodeError("Unterminated object", text, len(text))
+
+
+# Instructions shared by the single-action and batch prompts
+_PROMPT_INSTRUCTIONS = """You are the Game Master for a text-based adventure RPG. Your primary role is to interpret player actions and translate them into structured JSON data that updates the game's state.
 
 **Current Game State (for context, do not modify directly unless requested):**
 ```json
@@ -149,73 +233,342 @@ class LLMParser:
    
    - **narrative_hint**: (string or null) A brief, objective hint about what happened or changed in the world, not a full narrative description. This helps the game engine know what to describe next.
 
-Now, interpret the following player action:
+"""
+
+# Prompts, filled in per turn with str.format_map
+_PROMPT_TEMPLATE = _PROMPT_INSTRUCTIONS + """Now, interpret the following player action:
 
 **Player**: "{player_input}"
 
 Return ONLY valid JSON with no additional text:"""
+
+_BATCH_PROMPT_TEMPLATE = _PROMPT_INSTRUCTIONS + """Now, interpret the following player actions. They happen in order, each one after the previous one has taken effect:
+
+{player_inputs}
+
+Return ONLY a valid JSON object of the form {{"updates": [...]}}, where "updates" holds one object with the structure above for each action, in the same order. No additional text:"""
+
+
+class LLMParser:
+    """
+    Parser that uses Qwen2.5-14B via Ollama to interpret player actions.
+    
+    Attributes:
+        model_name (str): Name of the Ollama model to use
+        temperature (float): Temperature for generation (0.0 for deterministic)
+        keep_alive (str): How long Ollama keeps the model loaded after a request
+    """
+    
+    def __init__(self, model_name: str = "qwen2.5:14b", temperature: float = 0.0,
+                 keep_alive: str = "30m"):
+        """
+        Initialize the LLM parser.
+        
+        Args:
+            model_name (str): Ollama model identifier
+            temperature (float): Generation temperature
+            keep_alive (str): Ollama duration (e.g. "30m") to keep the model
+                resident between turns
+        """
+        self.model_name = model_name
+        self.temperature = temperature
+        self.keep_alive = keep_alive
+        self._cached_json: Optional[str] = None
+        self._cached_version: Optional[int] = None
+    
+    def parse_player_action(self, player_input: str, current_game_state: Mapping[str, Any],
+                            state_version: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Parse player's natural language action into structured JSON.
+        
+        Args:
+            player_input (str): Player's text input
+            current_game_state (dict): Current game world state
+            state_version (int, optional): GameEngine.state_version of the
+                given state; enables reuse of the serialized state
+        
+        Returns:
+            dict: Structured update data or error information
+        """
+        update = dict(self.stream_parse(player_input, current_game_state, state_version))
+        if 'error' in update:
+            return self._create_error_response(update['error'])
+        return update
+    
+    def stream_parse(self, player_input: str, current_game_state: Mapping[str, Any],
+                     state_version: Optional[int] = None) -> Iterator[Tuple[str, Any]]:
+        """
+        Parse player's action, yielding each update field as soon as it is generated.
+        
+        Every UPDATE_SCHEMA field is yielded exactly once: fields in the
+        order the LLM writes them, then any it left out with their defaults.
+        On failure a final ('error', message) pair is yielded instead, and
+        fields already yielded should be discarded.
+        
+        Args:
+            player_input (str): Player's text input
+            current_game_state (dict): Current game world state
+            state_version (int, optional): GameEngine.state_version of the given state
+        
+        Yields:
+            tuple: (field name, validated value)
+        """
+        try:
+            prompt = self._build_prompt(player_input, current_game_state, state_version)
+            
+            pieces = self._stream_response(prompt)
+            first = next(pieces, '')
+            
+            if not first:
+                yield 'error', "Empty response from LLM"
+                return
+            if not first.startswith('{'):
+                yield 'error', "LLM response is not a JSON object"
+                return
+            
+            seen = set()
+            try:
+                for field, value in _scan_fields(chain((first,), pieces)):
+                    validate = _FIELD_VALIDATORS.get(field)
+                    if validate is None or field in seen:
+                        continue
+                    seen.add(field)
+                    yield field, validate({field: value})[field]
+            
+            except json.JSONDecodeError as e:
+                print(f"⚠️  JSON parse error: {e}")
+                print(f"Raw response: {e.doc[:200]}...")
+                yield 'error', f"Invalid JSON from LLM: {str(e)}"
+                return
+            
+            except fastjsonschema.JsonSchemaException as e:
+                print(f"⚠️  Update schema error: {e}")
+                yield 'error', f"Malformed update from LLM: {str(e)}"
+                return
+            
+            if len(seen) < len(_FIELD_VALIDATORS):
+                defaults = _validate_update({})
+                for field in UPDATE_SCHEMA['properties']:
+                    if field not in seen:
+                        yield field, defaults[field]
+        
+        except Exception as e:
+            print(f"❌ Error communicating with Ollama: {e}")
+            yield 'error', f"LLM communication error: {str(e)}"
+    
+    def parse_player_actions_batch(self, player_inputs: List[str], current_game_state: Mapping[str, Any],
+                                   state_version: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Parse several queued player actions with a single LLM call.
+        
+        Args:
+            player_inputs (list): Player's text inputs, in the order typed
+            current_game_state (dict): Current game world state
+            state_version (int, optional): GameEngine.state_version of the given state
+        
+        Returns:
+            list: One structured update per input, or a single error response
+        """
+        try:
+            prompt = self._build_batch_prompt(player_inputs, current_game_state, state_version)
+            
+            response_text = self._generate(prompt)
+            
+            if response_text is None:
+                return [self._create_error_response("LLM response is not a JSON object")]
+            if not response_text:
+                return [self._create_error_response("Empty response from LLM")]
+            
+            try:
+                data = loads(response_text)
+                updates = data.get('updates') if isinstance(data, dict) else None
+                if not isinstance(updates, list) or len(updates) != len(player_inputs):
+                    return [self._create_error_response("LLM did not return one update per action")]
+                
+                return [self._to_update(update) for update in updates]
+            
+            except json.JSONDecodeError as e:
+                print(f"⚠️  JSON parse error: {e}")
+                print(f"Raw response: {response_text[:200]}...")
+                return [self._create_error_response(f"Invalid JSON from LLM: {str(e)}")]
+            
+            except fastjsonschema.JsonSchemaException as e:
+                print(f"⚠️  Update schema error: {e}")
+                return [self._create_error_response(f"Malformed update from LLM: {str(e)}")]
         
-        return prompt
+        except Exception as e:
+            print(f"❌ Error communicating with Ollama: {e}")
+            return [self._create_error_response(f"LLM communication error: {str(e)}")]
     
-    def _normalize_update_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    async def parse_player_action_async(self, player_input: str, current_game_state: Mapping[str, Any],
+                                        state_version: Optional[int] = None) -> Dict[str, Any]:
         """
-        Ensure all expected keys exist in update data with proper defaults.
+        Parse player's action in a worker thread without blocking the event loop.
+        
+        Lets async callers overlap other work (rendering, disk I/O) with the
+        multi-second LLM call.
         
         Args:
-            data (dict): Raw update data from LLM
+            player_input (str): Player's text input
+            current_game_state (dict): Current game world state
+            state_version (int, optional): GameEngine.state_version of the given state
+        
+        Returns:
+            dict: Structured update data or error information
+        """
+        return await asyncio.to_thread(
+            self.parse_player_action, player_input, current_game_state, state_version
+        )
+    
+    def warmup(self) -> bool:
+        """
+        Load the model into memory ahead of the first turn.
+        
+        Generates a single token so the first real action does not pay
+        the multi-second model load. Failures are left for the first real
+        request to report.
         
         Returns:
-            dict: Normalized update data
-        """
-        normalized = {
-            'player_actions': data.get('player_actions', []),
-            'inventory_changes': {
-                'added': [],
-                'removed': [],
-                'equipped': [],
-                'unequipped': []
-            },
-            'entity_interactions': data.get('entity_interactions', []),
-            'location_changes': {
-                'new_location_id': None,
-                'direction_moved': None,
-                'room_state_updates': []
-            },
-            'player_stats_changes': {
-                'health_change': 0,
-                'mana_change': 0,
-                'gold_change': 0,
-                'xp_gained': 0
-            },
-            'quest_updates': data.get('quest_updates', []),
-            'game_events': data.get('game_events', []),
-            'narrative_hint': data.get('narrative_hint', None)
-        }
-        
-        # Merge inventory changes
-        if 'inventory_changes' in data:
-            inv = data['inventory_changes']
-            normalized['inventory_changes']['added'] = inv.get('added', [])
-            normalized['inventory_changes']['removed'] = inv.get('removed', [])
-            normalized['inventory_changes']['equipped'] = inv.get('equipped', [])
-            normalized['inventory_changes']['unequipped'] = inv.get('unequipped', [])
-        
-        # Merge location changes
-        if 'location_changes' in data:
-            loc = data['location_changes']
-            normalized['location_changes']['new_location_id'] = loc.get('new_location_id')
-            normalized['location_changes']['direction_moved'] = loc.get('direction_moved')
-            normalized['location_changes']['room_state_updates'] = loc.get('room_state_updates', [])
-        
-        # Merge stats changes
-        if 'player_stats_changes' in data:
-            stats = data['player_stats_changes']
-            normalized['player_stats_changes']['health_change'] = stats.get('health_change', 0)
-            normalized['player_stats_changes']['mana_change'] = stats.get('mana_change', 0)
-            normalized['player_stats_changes']['gold_change'] = stats.get('gold_change', 0)
-            normalized['player_stats_changes']['xp_gained'] = stats.get('xp_gained', 0)
-        
-        return normalized
+            bool: True if the model answered
+        """
+        try:
+            ollama.generate(
+                model=self.model_name,
+                prompt='.',
+                keep_alive=self.keep_alive,
+                options={'num_predict': 1}
+            )
+            return True
+        except Exception:
+            return False
+    
+    def _stream_response(self, prompt: str) -> Iterator[str]:
+        """
+        Run the prompt through Ollama, yielding response text as it is generated.
+        
+        Args:
+            prompt (str): Complete prompt for LLM
+        
+        Yields:
+            str: Non-empty chunks of response text; leading whitespace
+                of the response is dropped
+        """
+        stream = ollama.generate(
+            model=self.model_name,
+            prompt=prompt,
+            format='json',
+            stream=True,
+            keep_alive=self.keep_alive,
+            options={
+                'temperature': self.temperature,
+                'num_predict': 1000  # Max tokens for response
+            }
+        )
+        
+        started = False
+        for chunk in stream:
+            piece = chunk.get('response', '')
+            if not started:
+                piece = piece.lstrip()
+                started = bool(piece)
+            if piece:
+                yield piece
+            if chunk.get('done'):
+                break
+    
+    def _generate(self, prompt: str) -> Optional[str]:
+        """
+        Run the prompt through Ollama and collect the whole response.
+        
+        Args:
+            prompt (str): Complete prompt for LLM
+        
+        Returns:
+            str or None: Response text, or None if the reply did not start
+                with a JSON object (the stream is abandoned early)
+        """
+        chunks = []
+        for piece in self._stream_response(prompt):
+            if not chunks and not piece.startswith('{'):
+                return None
+            chunks.append(piece)
+        
+        return ''.join(chunks).strip()
+    
+    def _to_update(self, data: Any) -> Dict[str, Any]:
+        """
+        Validate decoded LLM output as a structured update.
+        
+        Args:
+            data: Decoded JSON for one update
+        
+        Returns:
+            dict: Update with defaults filled in and only schema fields kept
+        
+        Raises:
+            fastjsonschema.JsonSchemaException: If data does not match UPDATE_SCHEMA
+        """
+        validated = _validate_update(data)
+        return {key: validated[key] for key in UPDATE_SCHEMA['properties']}
+    
+    def _state_json(self, game_state: Mapping[str, Any], state_version: Optional[int]) -> str:
+        """
+        Serialize the game state for a prompt, reusing the last result.
+        
+        Args:
+            game_state (dict): Current game state
+            state_version (int, optional): Version of game_state; the JSON
+                serialization is reused while the version is unchanged
+        
+        Returns:
+            str: Pretty-printed game state JSON
+        """
+        # dict() unwraps read-only views
+        if state_version is None or state_version != self._cached_version:
+            self._cached_json = dumps(dict(game_state))
+            self._cached_version = state_version
+        return self._cached_json
+    
+    def _build_prompt(self, player_input: str, game_state: Mapping[str, Any],
+                      state_version: Optional[int] = None) -> str:
+        """
+        Build the comprehensive prompt for the LLM.
+        
+        Args:
+            player_input (str): Player's action
+            game_state (dict): Current game state
+            state_version (int, optional): Version of game_state; the JSON
+                serialization is reused while the version is unchanged
+        
+        Returns:
+            str: Complete prompt for LLM
+        """
+        return _PROMPT_TEMPLATE.format_map({
+            'game_state_json': self._state_json(game_state, state_version),
+            'player_input': player_input
+        })
+    
+    def _build_batch_prompt(self, player_inputs: List[str], game_state: Mapping[str, Any],
+                            state_version: Optional[int] = None) -> str:
+        """
+        Build a prompt asking for one update per queued action.
+        
+        Args:
+            player_inputs (list): Player's actions, in order
+            game_state (dict): Current game state
+            state_version (int, optional): Version of game_state
+        
+        Returns:
+            str: Complete prompt for LLM
+        """
+        numbered = "\n".join(
+            f'**Player ({number})**: "{player_input}"'
+            for number, player_input in enumerate(player_inputs, 1)
+        )
+        return _BATCH_PROMPT_TEMPLATE.format_map({
+            'game_state_json': self._state_json(game_state, state_version),
+            'player_inputs': numbered
+        })
     
     def _create_error_response(self, error_message: str) -> Dict[str, Any]:
         """
@@ -227,28 +580,6 @@ Return ONLY valid JSON with no additional text:"""
         Returns:
             dict: Error response with empty update structure
         """
-        return {
-            'error': error_message,
-            'player_actions': [],
-            'inventory_changes': {
-                'added': [],
-                'removed': [],
-                'equipped': [],
-                'unequipped': []
-            },
-            'entity_interactions': [],
-            'location_changes': {
-                'new_location_id': None,
-                'direction_moved': None,
-                'room_state_updates': []
-            },
-            'player_stats_changes': {
-                'health_change': 0,
-                'mana_change': 0,
-                'gold_change': 0,
-                'xp_gained': 0
-            },
-            'quest_updates': [],
-            'game_events': [],
-            'narrative_hint': None
-        }
+        # The validator fills every default around the error key in one dict;
+        # its generated literals are cheaper than cloning a frozen template
+        return _validate_update({'error': error_message})
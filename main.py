@@ -6,190 +6,412 @@ This module handles the primary game loop, player input/output,
 and coordinates between the game engine and LLM parser.
 """
 
+import os
+import queue
+import select
 import sys
-from game_engine import GameEngine
-from llm_parser import LLMParser
-
-
-class GameDisplay:
-    """Handles all game display output with formatting."""
-    
-    @staticmethod
-    def print_header():
-        """Print the game header."""
-        print("\n" + "=" * 60)
-        print("    🗡️  LLM-DRIVEN TEXT ADVENTURE RPG  🗡️")
-        print("=" * 60)
-        print("Powered by Qwen2.5-14B Semantic World Engine")
-        print("=" * 60 + "\n")
-    
-    @staticmethod
-    def print_separator():
-        """Print a visual separator."""
-        print("\n" + "-" * 60 + "\n")
-    
-    @staticmethod
-    def print_location(location_data, location_id):
-        """
-        Display current location details.
-        
-        Args:
-            location_data (dict): Location information
-            location_id (str): Current location identifier
-        """
-        print(f"\n📍 Location: {location_id.replace('_', ' ').title()}")
-        print(f"\n{location_data.get('description', 'A mysterious place.')}")
-        
-        # Display items
-        items = location_data.get('items_present', [])
-        if items:
-            print(f"\n🎒 Items here: {', '.join(items)}")
-        
-        # Display NPCs
-        npcs = location_data.get('npcs_present', [])
-        if npcs:
-            print(f"\n👥 NPCs present: {', '.join(npcs)}")
-        
-        # Display exits
-        exits = location_data.get('exits', {})
-        if exits:
-            exit_list = [f"{direction} → {dest}" for direction, dest in exits.items()]
-            print(f"\n🚪 Exits: {', '.join(exit_list)}")
-    
-    @staticmethod
-    def print_player_stats(player_data):
-        """
-        Display player statistics.
-        
-        Args:
-            player_data (dict): Player information
-        """
-        print(f"\n❤️  Health: {player_data.get('health', 100)} | "
-              f"💰 Gold: {player_data.get('gold', 0)} | "
-              f"⭐ XP: {player_data.get('xp', 0)}")
-        
-        inventory = player_data.get('inventory', [])
-        if inventory:
-            print(f"🎒 Inventory: {', '.join(inventory)}")
+import threading
+from collections import deque
+from contextlib import closing
+from concurrent.futures import Future, wait
+from itertools import cycle
+from display import (
+    print_field_feedback, print_header, print_location, print_player_stats, print_separator,
+    print_update_feedback
+)
+from game_engine import GameEngine, SaveScheduler
+
+try:
+    import readline
+except ImportError:
+    # Not available on Windows; input() then works without history or completion
+    readline = None
+
+
+SPINNER_FRAMES = "|/-\\"
+
+ACTION_PROMPT = "🎮 Your action (or 'quit' to exit): "
+
+# Inputs handled locally rather than sent to the LLM
+QUIT_CMDS = frozenset({'quit', 'exit', 'q'})
+HELP_CMDS = frozenset({'help', '?'})
+STATS_CMDS = frozenset({'stats'})
+COMMAND_WORDS = QUIT_CMDS | HELP_CMDS | STATS_CMDS
+
+HELP_TEXT = (
+    "\n📖 Help:\n"
+    "  - Describe your actions naturally (e.g., 'go north', 'take dagger')\n"
+    "  - Talk to NPCs, examine items, fight enemies\n"
+    "  - Type 'quit' to save and exit\n"
+    "  - Type 'stats' to see detailed player info\n"
+    "  - Press Tab to complete exits, items and names in this room\n"
+)
+
+# How long to wait for further queued lines after the first one (seconds)
+INPUT_DEBOUNCE = 0.02
+
+# Input history kept across sessions (when readline is available)
+HISTORY_FILE = os.path.expanduser("~/.llm_rpg_history")
+HISTORY_LENGTH = 1000
+
+# Update fields that change no state, shown as soon as they stream in;
+# everything else is reported only once the update has been applied
+STREAMED_FIELDS = frozenset({'player_actions'})
+
+# Movement the game resolves itself, without asking the LLM
+MOVE_VERBS = frozenset({'go', 'move', 'head', 'walk', 'run'})
+DIRECTION_ALIASES = {
+    'n': 'north', 's': 'south', 'e': 'east', 'w': 'west', 'u': 'up', 'd': 'down',
+    'north': 'north', 'south': 'south', 'east': 'east', 'west': 'west', 'up': 'up', 'down': 'down'
+}
+
+# Words offered by tab completion in every room
+COMPLETION_VERBS = ('go', 'take', 'talk', 'attack', 'examine', 'quit', 'help', 'stats')
+
+
+def _movement_direction(player_input):
+    """
+    Recognise a plain movement command ("north", "n", "go north", "walk e").
+    
+    Args:
+        player_input (str): Player's text input
+    
+    Returns:
+        str or None: Canonical direction, or None if the input is not a
+            plain movement command
+    """
+    words = player_input.lower().split()
+    if len(words) == 2 and words[0] in MOVE_VERBS:
+        words = words[1:]
+    if len(words) != 1:
+        return None
+    return DIRECTION_ALIASES.get(words[0])
+
+
+def _fast_path(player_input, current_location):
+    """
+    Resolve a plain movement command locally, skipping the LLM.
+    
+    Handles "north", "n", "go north", "walk e" and the like when the
+    direction is an exit of the current location.
+    
+    Args:
+        player_input (str): Player's text input
+        current_location (dict): Current location data
+    
+    Returns:
+        dict or None: Complete structured update for the move, or None if
+            the input needs the LLM
+    """
+    direction = _movement_direction(player_input)
+    if direction is None:
+        return None
+    
+    destination = current_location.get('exits', {}).get(direction)
+    if destination is None:
+        return None
+    
+    return {
+        'player_actions': ['move'],
+        'inventory_changes': {'added': [], 'removed': [], 'equipped': [], 'unequipped': []},
+        'entity_interactions': [],
+        'location_changes': {
+            'new_location_id': destination,
+            'direction_moved': direction,
+            'room_state_updates': []
+        },
+        'player_stats_changes': {'health_change': 0, 'mana_change': 0, 'gold_change': 0, 'xp_gained': 0},
+        'quest_updates': [],
+        'game_events': [],
+        'narrative_hint': f"You head {direction}."
+    }
+
+
+def setup_readline():
+    """Enable tab completion and load input history, if readline is available."""
+    if readline is None:
+        return
+    
+    # macOS ships libedit, which uses its own binding syntax
+    if 'libedit' in (readline.__doc__ or ''):
+        readline.parse_and_bind('bind ^I rl_complete')
+    else:
+        readline.parse_and_bind('tab: complete')
+    readline.set_completer_delims(' \t\n')
+    readline.set_history_length(HISTORY_LENGTH)
+    try:
+        readline.read_history_file(HISTORY_FILE)
+    except OSError:
+        pass
+
+
+def save_history():
+    """Write input history for the next session, if readline is available."""
+    if readline is None:
+        return
+    try:
+        readline.write_history_file(HISTORY_FILE)
+    except OSError:
+        pass
+
+
+def set_completions(location):
+    """
+    Offer the current room's exits, items and NPCs (plus common verbs) on Tab.
+    
+    Args:
+        location (dict): Current location data
+    """
+    if readline is None:
+        return
+    
+    words = sorted(set(COMPLETION_VERBS).union(
+        location.get('exits', {}),
+        location.get('items_present', []),
+        location.get('npcs_present', [])
+    ))
+    
+    def complete(text, state):
+        matches = [word for word in words if word.startswith(text)]
+        return matches[state] if state < len(matches) else None
+    
+    readline.set_completer(complete)
+
+
+def read_player_inputs(prompt):
+    """
+    Read one line of input plus any further lines already waiting on stdin.
+    
+    Lines typed ahead while the LLM was busy (or piped in from a script)
+    are drained here so they can be sent to the LLM as one batch.
+    
+    Args:
+        prompt (str): Prompt shown before the first line
+    
+    Returns:
+        list: Stripped input lines, first line first
+    """
+    lines = [input(prompt).strip()]
+    try:
+        while select.select([sys.stdin], [], [], INPUT_DEBOUNCE)[0]:
+            line = sys.stdin.readline()
+            if not line:
+                break
+            lines.append(line.strip())
+    except (OSError, ValueError):
+        # select() does not support console handles on Windows
+        pass
+    return lines
+
+
+def _spin_until(is_done, message):
+    """
+    Animate a spinner next to message until is_done(timeout) returns True.
+    
+    Args:
+        is_done (callable): Waits up to the given number of seconds and
+            reports whether the awaited work has finished
+        message (str): Text shown next to the spinner
+    """
+    if not sys.stdout.isatty():
+        print(message)
+        is_done(None)
+        return
+    
+    for frame in cycle(SPINNER_FRAMES):
+        sys.stdout.write(f"\r{message} {frame}")
+        sys.stdout.flush()
+        if is_done(0.1):
+            break
+    
+    sys.stdout.write(f"\r{message}  \n")
+
+
+def wait_with_spinner(future, message):
+    """
+    Block until a future completes, animating a spinner on a terminal.
+    
+    Args:
+        future (Future): Pending background task
+        message (str): Text shown next to the spinner
+    
+    Returns:
+        The future's result
+    """
+    _spin_until(lambda timeout: bool(wait([future], timeout=timeout)[0]), message)
+    return future.result()
+
+
+def run_in_background(fn, *args):
+    """
+    Call fn(*args) on a daemon thread.
+    
+    LLM calls run here so the terminal stays responsive while waiting;
+    being a daemon, the thread never delays exit after Ctrl-C or quit.
+    
+    Args:
+        fn (callable): Function to call
+        *args: Positional arguments for fn
+    
+    Returns:
+        Future: Resolves to fn's result (or exception)
+    """
+    future = Future()
+    
+    def run():
+        future.set_running_or_notify_cancel()
+        try:
+            result = fn(*args)
+        except BaseException as e:
+            future.set_exception(e)
         else:
-            print("🎒 Inventory: Empty")
+            future.set_result(result)
     
-    @staticmethod
-    def print_update_feedback(update_data):
-        """
-        Display feedback about what happened during the turn.
-        
-        Args:
-            update_data (dict): Update information from LLM parser
-        """
-        # Player actions
-        actions = update_data.get('player_actions', [])
-        if actions:
-            print(f"\n✨ You: {', '.join(actions)}")
-        
-        # Inventory changes
-        inv_changes = update_data.get('inventory_changes', {})
-        added = inv_changes.get('added', [])
-        removed = inv_changes.get('removed', [])
-        
-        if added:
-            print(f"📦 Gained: {', '.join(added)}")
-        if removed:
-            print(f"📤 Lost: {', '.join(removed)}")
-        
-        # Entity interactions
-        interactions = update_data.get('entity_interactions', [])
-        for interaction in interactions:
-            entity_id = interaction.get('id', 'something')
-            action = interaction.get('action', 'interacted with')
-            outcome = interaction.get('outcome', '')
-            
-            msg = f"⚔️  {action.replace('_', ' ').capitalize()} {entity_id}"
-            if outcome:
-                msg += f" - {outcome}"
-            print(msg)
-        
-        # Stats changes
-        stats = update_data.get('player_stats_changes', {})
-        if stats.get('health_change', 0) != 0:
-            change = stats['health_change']
-            symbol = "+" if change > 0 else ""
-            print(f"❤️  Health {symbol}{change}")
-        
-        if stats.get('gold_change', 0) != 0:
-            change = stats['gold_change']
-            symbol = "+" if change > 0 else ""
-            print(f"💰 Gold {symbol}{change}")
-        
-        if stats.get('xp_gained', 0) > 0:
-            print(f"⭐ XP +{stats['xp_gained']}")
-        
-        # Quest updates
-        quests = update_data.get('quest_updates', [])
-        for quest in quests:
-            quest_id = quest.get('quest_id', 'Unknown')
-            status = quest.get('status', 'updated')
-            print(f"📜 Quest '{quest_id}': {status}")
-        
-        # Game events
-        events = update_data.get('game_events', [])
-        for event in events:
-            print(f"⚡ {event.replace('_', ' ').capitalize()}!")
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+
+def stream_with_spinner(items, message):
+    """
+    Consume a generator on a daemon thread, re-yielding its items here.
+    
+    A spinner is shown until the first item (or the end) arrives; later
+    items are yielded as soon as the thread produces them. If the caller
+    stops early (e.g. Ctrl-C), the producer is closed after its next item,
+    which also closes the underlying Ollama stream.
+    
+    Args:
+        items (generator): Slow producer, e.g. LLMParser.stream_parse()
+        message (str): Text shown next to the spinner
+    
+    Yields:
+        The generator's items, in order
+    """
+    results = queue.Queue()
+    arrived = threading.Event()
+    stopped = threading.Event()
+    end = object()
+    
+    def pump():
+        try:
+            for item in items:
+                if stopped.is_set():
+                    break
+                results.put(item)
+                arrived.set()
+        except BaseException as e:
+            results.put(e)
+        finally:
+            items.close()
+        results.put(end)
+        arrived.set()
+    
+    threading.Thread(target=pump, daemon=True).start()
+    try:
+        _spin_until(arrived.wait, message)
         
-        # Narrative hint
-        hint = update_data.get('narrative_hint')
-        if hint:
-            print(f"\n💭 {hint}")
+        while True:
+            item = results.get()
+            if item is end:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stopped.set()
+
+
+def warm_up_model():
+    """
+    Import the LLM parser and load the model, off the main thread.
+    
+    Runs on a daemon thread, so neither the ollama import nor the model
+    load delays the first prompt, and quitting never waits for them.
+    """
+    try:
+        from llm_parser import LLMParser
+    except ImportError:
+        return  # Reported when the first action needs the LLM
+    LLMParser().warmup()
 
 
 def main():
     """Main game loop."""
     # Initialize components
-    display = GameDisplay()
     engine = GameEngine()
-    parser = LLMParser()
+    parser = None  # Created on the first action that needs the LLM
+    
+    # Periodic snapshots are written in the background, off the turn path
+    saver = SaveScheduler(engine)
+    engine.save_scheduler = saver
+    
+    setup_readline()
+    
+    # Load the model while the save is read and the player reads the first room
+    threading.Thread(target=warm_up_model, daemon=True).start()
     
     # Display welcome
-    display.print_header()
+    print_header()
     
     # Load game state
     try:
         engine.load_state()
         print("✅ Game loaded successfully!")
-    except Exception as e:
+    except (OSError, ValueError) as e:
         print(f"⚠️  Error loading game: {e}")
         print("Starting new game...")
     
     # Main game loop
     running = True
     first_turn = True
+    pending = deque()
+    unbatched = 0  # Queued actions to send to the LLM one at a time
+    
+    # Lookups derived from the state, reused until the state version changes
+    cached_version = None
+    context_view = None
     
     while running:
         try:
-            display.print_separator()
+            print_separator()
             
-            # Get current game state
-            state = engine.get_state()
-            player = state.get('player', {})
-            location_id = player.get('location_id', 'unknown')
-            locations = state.get('locations', {})
-            current_location = locations.get(location_id, {})
+            # Get current game state (read-only, no copy needed), unless
+            # nothing has been applied since the last turn
+            version = getattr(engine, 'state_version', None)
+            if version is None or version != cached_version:
+                state = engine.get_state_readonly()
+                player = state.get('player', {})
+                location_id = player.get('location_id', 'unknown')
+                locations = state.get('locations', {})
+                current_location = locations.get(location_id, {})
+                set_completions(current_location)
+                context_view = None
+                cached_version = version
             
             # Display current state
             if first_turn or location_id:
-                display.print_location(current_location, location_id)
-                display.print_player_stats(player)
+                print_location(current_location, location_id)
+                print_player_stats(player)
                 first_turn = False
             
-            display.print_separator()
+            print_separator()
             
-            # Get player input
-            player_input = input("🎮 Your action (or 'quit' to exit): ").strip()
+            # Get player input, taking lines typed ahead from the queue first
+            retrying = unbatched > 0
+            if pending:
+                player_input = pending.popleft()
+                unbatched = max(0, unbatched - 1)
+                print(f"{ACTION_PROMPT}{player_input}")
+            else:
+                player_input, *typed_ahead = read_player_inputs(ACTION_PROMPT)
+                pending.extend(typed_ahead)
+            
+            command = player_input.lower()
             
             # Handle quit
-            if player_input.lower() in ['quit', 'exit', 'q']:
+            if command in QUIT_CMDS:
                 print("\n💾 Saving game...")
-                engine.save_state()
+                saver.flush()
                 print("👋 Thanks for playing! Goodbye!")
                 running = False
                 continue
@@ -200,54 +422,111 @@ def main():
                 continue
             
             # Handle special commands
-            if player_input.lower() in ['help', '?']:
-                print("\n📖 Help:")
-                print("  - Describe your actions naturally (e.g., 'go north', 'take dagger')")
-                print("  - Talk to NPCs, examine items, fight enemies")
-                print("  - Type 'quit' to save and exit")
-                print("  - Type 'stats' to see detailed player info")
+            if command in HELP_CMDS:
+                sys.stdout.write(HELP_TEXT)
                 continue
             
-            if player_input.lower() == 'stats':
-                display.print_player_stats(player)
+            if command in STATS_CMDS:
+                print_player_stats(player)
                 continue
             
-            # Parse action with LLM
-            print("\n🤔 Interpreting your action...")
-            update_data = parser.parse_player_action(player_input, state)
-            
-            # Check for parsing errors
-            if update_data.get('error'):
-                print(f"❌ Error: {update_data['error']}")
-                print("💡 Try rephrasing your action or type 'help' for guidance.")
+            # Plain movement through a known exit needs no interpretation
+            update_data = _fast_path(player_input, current_location)
+            if update_data is not None:
+                if engine.apply_update(update_data):
+                    print_update_feedback(update_data)
+                else:
+                    print("⚠️  Could not apply update. Game state unchanged.")
                 continue
             
-            # Apply update to game state
-            success = engine.apply_update(update_data)
+            # Queued plain actions that follow go to the LLM in the same call,
+            # unless they are being retried after an unusable batch reply. The
+            # batch ends at commands and at plain moves, which are handled
+            # locally on their own turn (once the room they start from is known)
+            actions = [player_input]
+            if not retrying:
+                while (pending and pending[0] and pending[0].lower() not in COMMAND_WORDS
+                       and _movement_direction(pending[0]) is None):
+                    actions.append(pending.popleft())
             
-            if success:
-                # Display feedback
-                display.print_update_feedback(update_data)
-                
-                # Auto-save after each turn
-                engine.save_state()
+            # Parse action(s) with LLM
+            if parser is None:
+                from llm_parser import LLMParser
+                parser = LLMParser()
+            if context_view is None:
+                context_view = engine.get_context_view()
+            print()
+            if len(actions) == 1:
+                # Echo the interpreted actions as soon as the LLM has written them
+                update_data = {}
+                fields = stream_with_spinner(
+                    parser.stream_parse(player_input, context_view, version),
+                    "🤔 Interpreting your action..."
+                )
+                with closing(fields):
+                    for field, value in fields:
+                        if field in STREAMED_FIELDS:
+                            print_field_feedback(field, value)
+                        update_data[field] = value
+                updates = [update_data]
+                streamed = True
             else:
-                print("⚠️  Could not apply update. Game state unchanged.")
+                for queued in actions[1:]:
+                    print(f"{ACTION_PROMPT}{queued}")
+                future = run_in_background(
+                    parser.parse_player_actions_batch,
+                    actions, context_view, version
+                )
+                updates = wait_with_spinner(future, f"🤔 Interpreting your {len(actions)} actions...")
+                streamed = False
+                
+                # Unusable batch reply: retry each action on its own rather
+                # than dropping them all
+                if len(updates) == 1 and updates[0].get('error'):
+                    print(f"⚠️  {updates[0]['error']}")
+                    print("🔁 Interpreting the actions one at a time instead...")
+                    pending.extendleft(reversed(actions))
+                    unbatched = len(actions)
+                    continue
+            
+            for index, update_data in enumerate(updates):
+                # Check for parsing errors
+                if update_data.get('error'):
+                    print(f"❌ Error: {update_data['error']}")
+                    print("💡 Try rephrasing your action or type 'help' for guidance.")
+                    break
+                
+                # Apply update to game state
+                success = engine.apply_update(update_data)
+                
+                if success:
+                    # Display feedback (apply_update already journaled the turn)
+                    print_update_feedback(update_data, STREAMED_FIELDS if streamed else frozenset())
+                else:
+                    print("⚠️  Could not apply update. Game state unchanged.")
+                    # Later batch updates assumed this one took effect
+                    remaining = actions[index + 1:]
+                    if remaining:
+                        print(f"🔁 Re-interpreting one at a time: {', '.join(remaining)}")
+                        pending.extendleft(reversed(remaining))
+                        unbatched = len(remaining)
+                    break
         
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, EOFError):
             print("\n\n⚠️  Game interrupted. Saving...")
-            engine.save_state()
+            saver.flush()
             print("👋 Goodbye!")
             running = False
         
-        except Exception as e:
+        # I/O failures and malformed data in the save or the LLM's reply;
+        # save_state() handles (and logs) its own errors
+        except (OSError, ValueError, TypeError, AttributeError) as e:
             print(f"\n❌ Unexpected error: {e}")
             print("💾 Attempting to save game state...")
-            try:
-                engine.save_state()
-            except:
-                pass
+            saver.flush()
             print("Game continues...")
+    
+    save_history()
 
 
 if __name__ == "__main__":
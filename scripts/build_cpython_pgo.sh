@@ -0,0 +1,41 @@
+#!/usr/bin/env bash
+#
+# Build a CPython with profile-guided optimization (PGO) and link-time
+# optimization (LTO), trained on this game's main loop.
+#
+# Usage: scripts/build_cpython_pgo.sh [VERSION] [PREFIX]
+#   VERSION  CPython release to build (default: 3.12.7)
+#   PREFIX   Install location (default: ~/.local/cpython-pgo)
+#
+# Needs a C toolchain, curl and CPython's usual build dependencies
+# (including readline headers for tab completion). Afterwards, create a
+# virtual environment from the new interpreter and install
+# requirements.txt into it:
+#
+#   ~/.local/cpython-pgo/bin/python3.12 -m venv venv-pgo
+#   venv-pgo/bin/pip install -r requirements.txt
+#   venv-pgo/bin/python main.py
+
+set -euo pipefail
+
+VERSION="${1:-3.12.7}"
+PREFIX="${2:-$HOME/.local/cpython-pgo}"
+REPO_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+BUILD_DIR="$(mktemp -d)"
+trap 'rm -rf "$BUILD_DIR"' EXIT
+
+echo "📥 Downloading CPython ${VERSION}..."
+curl -fsSL "https://www.python.org/ftp/python/${VERSION}/Python-${VERSION}.tgz" | tar -xz -C "$BUILD_DIR"
+cd "$BUILD_DIR/Python-${VERSION}"
+
+echo "🔧 Configuring (PGO + LTO)..."
+./configure --prefix="$PREFIX" --enable-optimizations --with-lto
+
+# PROFILE_TASK replaces the default training run (a slice of CPython's
+# test suite) with scripted sessions of the game loop
+echo "🏗️  Building and training on the game loop..."
+make -j"$(nproc 2>/dev/null || sysctl -n hw.ncpu)" \
+    PROFILE_TASK="$REPO_DIR/scripts/pgo_training.py"
+make altinstall
+
+echo "✅ Installed ${PREFIX}/bin/python${VERSION%.*}"
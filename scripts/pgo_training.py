@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+PGO Training Workload for the Game Loop
+
+Plays scripted sessions of main.main() so a profile-guided CPython build
+(see build_cpython_pgo.sh) is optimized for this game's hot paths:
+input handling, state lookups, movement, journaling and rendering.
+
+Sessions only use local commands and plain movement, which never reach
+the LLM, so no Ollama server or third-party package is needed.
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+import main  # noqa: E402  (needs REPO_DIR on sys.path)
+
+# Number of sessions played, each from a fresh copy of the initial state
+ROUNDS = 1000
+
+# One loop through the starting world, ending back in the cave
+TOUR = ['n', 'e', 'stats', 'n', 's', 'help', 'go east', 'walk west', '', 'west', 'south']
+
+SESSION_INPUT = "\n".join(TOUR * 5 + ['quit']) + "\n"
+
+
+def play_session(work_dir):
+    """
+    Play one scripted session in work_dir.
+    
+    Args:
+        work_dir (str): Directory holding a fresh game_data/initial_state.json
+    """
+    os.chdir(work_dir)
+    sys.stdin = io.StringIO(SESSION_INPUT)
+    try:
+        main.main()
+    finally:
+        sys.stdin = sys.__stdin__
+
+
+def run():
+    """Play ROUNDS sessions without touching the player's save or history."""
+    initial_state = os.path.join(REPO_DIR, 'game_data', 'initial_state.json')
+    if not os.path.exists(initial_state):
+        initial_state = os.path.join(REPO_DIR, 'initial_state.json')
+    
+    # No model to load and no history to keep
+    main.warm_up_model = lambda: None
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        main.HISTORY_FILE = os.path.join(tmp, 'history')
+        work_dir = os.path.join(tmp, 'session')
+        
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            for _ in range(ROUNDS):
+                shutil.rmtree(work_dir, ignore_errors=True)
+                os.makedirs(os.path.join(work_dir, 'game_data'))
+                shutil.copy(initial_state, os.path.join(work_dir, 'game_data'))
+                play_session(work_dir)
+        
+        os.chdir(REPO_DIR)
+    
+    print(f"✅ Played {ROUNDS} training sessions")
+
+
+if __name__ == "__main__":
+    run()
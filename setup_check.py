@@ -9,6 +9,12 @@ before starting the game.
 import sys
 import subprocess
 import os
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Serializes the shared `ollama list` probe (see _run_ollama_list)
+_OLLAMA_LIST_LOCK = threading.Lock()
 
 
 def print_header(text):
@@ -36,17 +42,46 @@ def check_python_version():
     return passed, message
 
 
-def check_ollama_installed():
-    """Check if Ollama is installed."""
+@functools.lru_cache(maxsize=None)
+def _ollama_list_result():
+    """Run `ollama list` once; returns ((returncode, stdout), None) or (None, error)."""
     try:
         result = subprocess.run(
-            ['ollama', '--version'],
+            ['ollama', 'list'],
             capture_output=True,
             text=True,
-            timeout=5
+            timeout=10
         )
-        version = result.stdout.strip()
-        return True, f"Ollama found: {version}"
+        return (result.returncode, result.stdout), None
+    except (OSError, subprocess.SubprocessError) as e:
+        return None, e
+
+
+def _run_ollama_list():
+    """
+    Return (returncode, stdout) of `ollama list`, spawning it at most once.
+    
+    Both Ollama checks read this result and run concurrently, so the
+    lock makes the second caller wait for the first call's cached value.
+    
+    Raises:
+        FileNotFoundError: If the ollama executable is not installed
+        subprocess.TimeoutExpired: If the command timed out
+    """
+    with _OLLAMA_LIST_LOCK:
+        output, error = _ollama_list_result()
+    if error is not None:
+        raise error
+    return output
+
+
+def check_ollama_installed():
+    """Check if Ollama is installed."""
+    try:
+        returncode, _ = _run_ollama_list()
+        if returncode != 0:
+            return True, "Ollama found (server not responding, run: ollama serve)"
+        return True, "Ollama found"
     except FileNotFoundError:
         return False, "Ollama not found. Install from https://ollama.ai/"
     except subprocess.TimeoutExpired:
@@ -58,14 +93,11 @@ def check_ollama_installed():
 def check_qwen_model():
     """Check if Qwen2.5-14B model is available."""
     try:
-        result = subprocess.run(
-            ['ollama', 'list'],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
+        returncode, stdout = _run_ollama_list()
+        if returncode != 0:
+            return False, "Cannot list models (is the Ollama server running?)"
         
-        models = result.stdout.lower()
+        models = stdout.lower()
         has_14b = 'qwen2.5:14b' in models
         has_7b = 'qwen2.5:7b' in models or 'qwen2.5' in models
         
@@ -87,7 +119,8 @@ def check_dependencies():
     """Check if required Python packages are installed."""
     try:
         import ollama
-        return True, "ollama package installed"
+        import fastjsonschema
+        return True, "ollama and fastjsonschema packages installed"
     except ImportError:
         return False, "Run: pip install -r requirements.txt"
 
@@ -96,16 +129,29 @@ def check_game_files():
     """Check if essential game files exist."""
     essential_files = [
         'main.py',
+        'display.py',
         'game_engine.py',
         'llm_parser.py',
+        'json_utils.py',
         'game_data/initial_state.json',
         'requirements.txt'
     ]
     
-    missing = []
+    # Group by directory so each directory is listed once instead of
+    # stat()-ing every file
+    wanted = {}
     for file in essential_files:
-        if not os.path.exists(file):
-            missing.append(file)
+        directory, name = os.path.split(file)
+        wanted.setdefault(directory, set()).add(name)
+    
+    missing = []
+    for directory, names in wanted.items():
+        try:
+            with os.scandir(directory or '.') as entries:
+                present = {entry.name for entry in entries}
+        except FileNotFoundError:
+            present = set()
+        missing.extend(os.path.join(directory, name) for name in sorted(names - present))
     
     if missing:
         return False, f"Missing files: {', '.join(missing)}"
@@ -126,11 +172,16 @@ def main():
     
     all_passed = True
     
-    for check_name, check_func in checks:
-        passed, message = check_func()
-        print_status(check_name, passed, message)
-        if not passed:
-            all_passed = False
+    # Checks are independent and mostly wait on subprocesses and imports,
+    # so run them concurrently; results are printed in declaration order
+    # as soon as each one (and every check before it) has finished
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = [(check_name, executor.submit(check_func)) for check_name, check_func in checks]
+        for check_name, future in futures:
+            passed, message = future.result()
+            print_status(check_name, passed, message)
+            if not passed:
+                all_passed = False
     
     print("\n" + "=" * 60)
     